@@ -1,11 +1,18 @@
+import asyncio
 import discord
-import logging
+import functools
+import io
+import logging as stdlib_logging
 import os
+import queue
+import shlex
 import subprocess
-import tempfile
+import threading
 import time
+from collections import Counter, OrderedDict
 from datetime import datetime
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+from discord.oggparse import OggStream
 from dotenv import load_dotenv
 
 # Load environment variables first
@@ -18,6 +25,7 @@ import newrelic.agent
 NEW_RELIC_LICENSE_KEY = os.getenv('NEW_RELIC_LICENSE_KEY')
 NEW_RELIC_APP_NAME = os.getenv('NEW_RELIC_APP_NAME', 'Discord-Bellboy-Bot')
 NEW_RELIC_ENVIRONMENT = os.getenv('NEW_RELIC_ENVIRONMENT', 'production')
+NR_ENABLED = bool(NEW_RELIC_LICENSE_KEY)  # Hot paths skip agent calls entirely when monitoring is off
 
 if NEW_RELIC_LICENSE_KEY:
     # When using newrelic-admin run-program, the agent is automatically initialized
@@ -35,6 +43,19 @@ if NEW_RELIC_LICENSE_KEY:
 else:
     print("New Relic license key not found - monitoring disabled")
 
+# picologging is a faster drop-in for the stdlib logging API. It is opt-in and never used with
+# New Relic, whose log forwarding only hooks stdlib logging (app/tts/tts_manager.py makes the same choice)
+USE_PICOLOGGING = os.getenv('USE_PICOLOGGING', '').lower() in ('1', 'true', 'yes') and not NR_ENABLED
+try:
+    if not USE_PICOLOGGING:
+        raise ImportError('picologging not enabled')
+    import picologging as logging
+    from picologging import handlers as log_handlers
+except ImportError:
+    USE_PICOLOGGING = False
+    import logging
+    from logging import handlers as log_handlers
+
 # Try to import TTS, but make it optional
 try:
     from tts import TTSManager
@@ -43,6 +64,14 @@ except ImportError:
     TTS_AVAILABLE = False
     TTSManager = None
 
+# Try to import uvloop for a faster event loop, but make it optional
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+    uvloop = None
+
 # Configuration
 DISCORD_TOKEN = os.getenv('DISCORD_TOKEN')
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
@@ -50,17 +79,128 @@ TTS_PROVIDER = os.getenv('TTS_PROVIDER', 'coqui')  # Default to coqui
 IGNORED_CHANNEL_ID = os.getenv('IGNORED_CHANNEL_ID')  # Channel ID to ignore when selecting busiest channel
 IGNORED_USERS = os.getenv('IGNORED_USERS', '')  # Comma-separated user IDs to never announce
 
+# Parsed once at import; these settings are constant for the lifetime of the process
+IGNORED_USER_IDS = frozenset(int(uid) for uid in IGNORED_USERS.split(',') if uid.strip().isdigit())
+IGNORED_CHANNEL_ID_INT = int(IGNORED_CHANNEL_ID) if IGNORED_CHANNEL_ID and IGNORED_CHANNEL_ID.strip().isdigit() else None
+
 # Constants
 LOGS_DIR = 'logs'
 LOG_DATE_FORMAT = '%Y%m%d'
 LOG_MESSAGE_FORMAT = '%(asctime)s | %(levelname)s | %(message)s'
+LOG_FORMATTER = logging.Formatter(LOG_MESSAGE_FORMAT)  # Shared by the file and console handlers
+LOG_FILEPATH = os.path.join(LOGS_DIR, f"bellboy_{time.strftime(LOG_DATE_FORMAT)}.log")
+RECONCILE_DEBOUNCE_SECONDS = 0.5  # Quiet period before re-evaluating which channel to be in
+ANNOUNCE_DEBOUNCE_SECONDS = 0.4  # Quiet period before announcing a burst of voice events
+PREWARM_CLIP_INTERVAL_SECONDS = 0.5  # Pause between background renders, leaving CPU for live synthesis
+PREWARM_MAX_MEMBERS = 1024  # Members remembered as pre-synthesized before the oldest are forgotten
+PREWARM_ACTIONS = ('leave', 'move')  # A member already in voice can only leave or move next
+
+# Discriminator reported for webhook users
+WEBHOOK_DISCRIMINATOR = '0000'
+
+# Voice state transitions keyed by (before.channel is None, after.channel is None)
+VOICE_TRANSITIONS = {
+    (True, False): 'join',
+    (False, True): 'leave',
+    (False, False): 'move',
+}
+
+# Per-action attribute value, metric name and log format for each voice transition
+VOICE_ACTIONS = {
+    'join': ('joined', 'Custom/Discord/UserJoined', "[%s] %s joined voice channel: %s"),
+    'leave': ('left', 'Custom/Discord/UserLeft', "[%s] %s left voice channel: %s"),
+    'move': ('moved', 'Custom/Discord/UserMoved', "[%s] %s moved from %s to %s"),
+}
+
+# Application logger, resolved once
+logger = logging.getLogger('bellboy')
+
+# LOG_MESSAGE_FORMAT never shows process/thread/task names, so don't collect them per record.
+# These switches only exist in the stdlib module (picologging has none), so set them there
+# explicitly: they cover the stdlib fallback and discord.py's own loggers either way
+stdlib_logging.logProcesses = False
+stdlib_logging.logThreads = False
+stdlib_logging.logMultiprocessing = False
+stdlib_logging.logAsyncioTasks = False
 
-# FFmpeg options for audio playback
+# Create logs directory once at import
+os.makedirs(LOGS_DIR, exist_ok=True)
+
+# FFmpeg options for audio playback. Inputs are short local MP3/WAV clips, so a small probe
+# window is enough to detect the format and avoids scanning/buffering before the first packet
 FFMPEG_OPTIONS = {
-    'before_options': '-nostdin',
+    'before_options': '-nostdin -probesize 32768 -analyzeduration 0 -fflags nobuffer',
     'options': '-vn -filter:a "volume=1.1"'
 }
 
+# Opus bitrate (kbps) FFmpeg encodes notification audio at
+AUDIO_BITRATE_KBPS = 96
+
+# Audio source factory with the FFmpeg options pre-bound. FFmpeg emits Opus packets
+# directly, so discord.py does not have to encode PCM to Opus itself during playback.
+_make_audio_source = functools.partial(discord.FFmpegOpusAudio, bitrate=AUDIO_BITRATE_KBPS, **FFMPEG_OPTIONS)
+
+# Clips pre-encoded to Opus already have the volume applied, so FFmpeg only has to demux them
+_make_opus_copy_source = functools.partial(
+    discord.FFmpegOpusAudio, codec='copy', before_options=FFMPEG_OPTIONS['before_options'], options='-vn'
+)
+
+# Maximum number of notification clips kept pre-encoded in memory
+OPUS_CACHE_MAX_ENTRIES = 64
+
+# Per-guild playback queue: maximum pending notifications and the longest a single clip may play
+AUDIO_QUEUE_MAX_SIZE = 8
+AUDIO_PLAYBACK_TIMEOUT_SECONDS = 30.0
+
+# Audio files smaller than this are treated as missing (e.g. left empty by a crashed synthesis)
+MIN_AUDIO_FILE_BYTES = 128
+
+# Voice event counters are aggregated in-process and reported to New Relic at this interval
+METRICS_FLUSH_INTERVAL_SECONDS = 10.0
+
+
+class CachedOpusAudio(discord.AudioSource):
+    """Audio source that replays pre-encoded Opus packets from memory, without spawning FFmpeg."""
+
+    def __init__(self, packets: List[bytes]):
+        self._packets = iter(packets)
+
+    def read(self) -> bytes:
+        return next(self._packets, b'')
+
+    def is_opus(self) -> bool:
+        return True
+
+
+def _is_playable_file(audio_path: str) -> bool:
+    """Check that an audio file exists and isn't empty with a single stat call."""
+    try:
+        return os.stat(audio_path).st_size >= MIN_AUDIO_FILE_BYTES
+    except OSError:
+        return False
+
+
+def _encode_opus_packets(audio_path: str) -> List[bytes]:
+    """Encode an audio file to Opus packets with the same filters used for live playback."""
+    # Clips pre-encoded to Ogg Opus at synthesis time are read as-is, without running ffmpeg
+    if audio_path.endswith('.opus'):
+        with open(audio_path, 'rb') as f:
+            return list(OggStream(f).iter_packets())
+
+    ffmpeg_cmd = [
+        'ffmpeg', *shlex.split(FFMPEG_OPTIONS['before_options']),
+        '-i', audio_path,
+        '-map_metadata', '-1',
+        '-f', 'opus', '-c:a', 'libopus', '-ar', '48000', '-ac', '2',
+        '-b:a', f'{AUDIO_BITRATE_KBPS}k',
+        '-loglevel', 'warning',
+        '-fec', 'true', '-packet_loss', '15',
+        *shlex.split(FFMPEG_OPTIONS['options']),
+        'pipe:1'
+    ]
+    result = subprocess.run(ffmpeg_cmd, capture_output=True, timeout=30, check=True)
+    return list(OggStream(io.BytesIO(result.stdout)).iter_packets())
+
 
 class BellboyBot(discord.Client):
     """
@@ -73,15 +213,18 @@ class BellboyBot(discord.Client):
 
     def __init__(self):
         # Set up intents
+        # Only voice states are needed: members in voice channels arrive with their voice state and
+        # are cached from it, so the members intent (full member chunks, member updates) is not used
         intents = discord.Intents.default()
         intents.voice_states = True
-        intents.members = True
+        intents.typing = False
+        intents.messages = False
 
         super().__init__(intents=intents)
 
         # Set up logging
         self._setup_logging()
-        self.logger = logging.getLogger('bellboy')
+        self.logger = logger
 
         # Initialize Coqui TTS
         self._init_tts()
@@ -89,33 +232,86 @@ class BellboyBot(discord.Client):
         # Per-user cooldown tracking: member_id -> last salute timestamp
         self._user_cooldowns: Dict[int, float] = {}
 
-        # Test New Relic transaction
+        # The bot's own user ID, known once logged in
+        self._bot_user_id: Optional[int] = None
+
+        # Sanitized guild names for logging: guild_id -> safe name
+        self._guild_name_cache: Dict[int, str] = {}
+
+        # Incrementally maintained human counts: guild_id -> {channel_id: count}
+        self._human_counts: Dict[int, Dict[int, int]] = {}
+
+        # Voice channel lists per guild: guild_id -> channels (dropped on channel create/delete)
+        self._vc_cache: Dict[int, List[discord.VoiceChannel]] = {}
+
+        # Pre-encoded notification clips: audio_path -> Opus packets (LRU)
+        self._opus_cache: "OrderedDict[str, List[bytes]]" = OrderedDict()
+
+        # Audio paths already confirmed to exist; dropped again if playing one fails
+        self._verified_audio_paths: set = set()
+
+        # Per-guild notification playback: guild_id -> queue of (audio_path, packets) and its worker
+        self._audio_queues: Dict[int, asyncio.Queue] = {}
+        self._audio_workers: Dict[int, asyncio.Task] = {}
+
+        # Debounced join/leave re-evaluations: guild_id -> pending task
+        self._reconcile_tasks: Dict[int, asyncio.Task] = {}
+
+        # Per-guild locks serializing connect/move/disconnect: guild_id -> lock
+        self._voice_locks: Dict[int, asyncio.Lock] = {}
+
+        # Debounced announcements: guild_id -> {member_id: (action, display_name)} and the pending flush
+        self._pending_announcements: Dict[int, Dict[int, Tuple[str, str]]] = {}
+        self._announce_tasks: Dict[int, asyncio.Task] = {}
+
+        # Members whose announcement variants were pre-synthesized, and the running background tasks
+        self._prewarmed_members: "OrderedDict[int, None]" = OrderedDict()
+        self._prewarm_lock = asyncio.Lock()
+        self._background_tasks: set = set()
+
+        # Serializes every render on the (single, shared) TTS model, live or background
+        self._synthesis_lock = asyncio.Lock()
+
+        # Live announcement renders in progress or waiting; background renders hold off meanwhile
+        self._live_synthesis_count = 0
+        self._live_synthesis_idle = asyncio.Event()
+        self._live_synthesis_idle.set()
+
+        # Pending voice and audio event counts (metric name -> count), flushed by _flush_metrics_periodically
+        self._metric_counts: Counter = Counter()
+        self._metrics_task: Optional[asyncio.Task] = None
+
+        # New Relic application handle, resolved once (None when monitoring is off)
+        self._nr_app = newrelic.agent.application() if NR_ENABLED else None
+
+        # Test New Relic transaction off the startup path - the agent may still be connecting
         if NEW_RELIC_LICENSE_KEY:
-            self._test_newrelic_transaction()
+            threading.Thread(target=self._test_newrelic_transaction, daemon=True).start()
 
     def _setup_logging(self) -> None:
         """Set up logging to file and console."""
-        # Create logs directory if it doesn't exist
-        os.makedirs(LOGS_DIR, exist_ok=True)
-
-        # Create logger
-        logger = logging.getLogger('bellboy')
+        # Configure logger
         logger.setLevel(getattr(logging, LOG_LEVEL, logging.INFO))
 
         # Clear existing handlers to avoid duplicates
         logger.handlers.clear()
 
         # File handler
-        log_filename = f"bellboy_{datetime.now().strftime(LOG_DATE_FORMAT)}.log"
-        log_filepath = os.path.join(LOGS_DIR, log_filename)
-        file_handler = logging.FileHandler(log_filepath, encoding='utf-8')
-        file_handler.setFormatter(logging.Formatter(LOG_MESSAGE_FORMAT))
-        logger.addHandler(file_handler)
+        file_handler = logging.FileHandler(LOG_FILEPATH, encoding='utf-8')
+        file_handler.setFormatter(LOG_FORMATTER)
 
         # Console handler
         console_handler = logging.StreamHandler()
-        console_handler.setFormatter(logging.Formatter(LOG_MESSAGE_FORMAT))
-        logger.addHandler(console_handler)
+        console_handler.setFormatter(LOG_FORMATTER)
+
+        # Enqueue records and let a background thread do the blocking file/console writes,
+        # so logging from event handlers never stalls the event loop
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(log_handlers.QueueHandler(log_queue))
+        self._log_listener = log_handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
 
     def _init_tts(self) -> None:
         """Initialize TTS manager."""
@@ -128,29 +324,37 @@ class BellboyBot(discord.Client):
 
         try:
             # Initialize TTS manager with configured provider
-            self.logger.info(f"Initializing TTS Manager with provider: {TTS_PROVIDER}")
+            self.logger.info("Initializing TTS Manager with provider: %s", TTS_PROVIDER)
             self.tts_manager = TTSManager(provider_name=TTS_PROVIDER)
 
             # Initialize asynchronously - we'll do this in the ready event
             self.logger.info("TTS Manager created, will initialize on bot ready")
 
         except Exception as e:
-            self.logger.error(f"Failed to create TTS Manager: {e}")
+            self.logger.error("Failed to create TTS Manager: %s", e)
             self.logger.warning("TTS functionality will be disabled")
             self.tts_manager = None
 
     def _safe_guild_name(self, guild: discord.Guild) -> str:
-        """Get a safe representation of guild name for logging."""
-        try:
-            return guild.name
-        except UnicodeEncodeError:
-            return guild.name.encode('ascii', errors='replace').decode('ascii')
-        except Exception:
-            return f"Guild_{guild.id}"
+        """Get a safe representation of guild name for logging (cached per guild)."""
+        name = self._guild_name_cache.get(guild.id)
+        if name is None:
+            name = self._guild_name_cache.setdefault(guild.id, self._compute_safe_guild_name(guild))
+        return name
+
+    def _compute_safe_guild_name(self, guild: discord.Guild) -> str:
+        """Compute a safe representation of guild name for logging."""
+        # guild.name is already a str, so reading it cannot raise UnicodeEncodeError;
+        # only a missing/empty name (e.g. an unavailable guild) needs a fallback
+        name = getattr(guild, 'name', None)
+        return name if name else f"Guild_{guild.id}"
 
     def _format_member_info(self, member: discord.Member) -> str:
         """Format member information for logging."""
         try:
+            # Accounts on the new username system have no discriminator ("0")
+            if member.discriminator == '0':
+                return f"{member.display_name} ({member.name})"
             return f"{member.display_name} ({member.name}#{member.discriminator})"
         except Exception:
             return f"Member_{member.id}"
@@ -160,17 +364,49 @@ class BellboyBot(discord.Client):
         if channel is None:
             return 0
 
-        # Filter out bots, applications, and the bot itself
-        human_members = [member for member in channel.members if self._is_human_member(member)]
-
-        member_names = [m.display_name for m in human_members]
-        self.logger.debug(f"Channel '{channel.name}' has {len(human_members)} human members: {member_names}")
-        return len(human_members)
+        # Filter out bots, applications, and the bot itself without building a throwaway list
+        human_count = sum(1 for member in channel.members if self._is_human_member(member))
+
+        self.logger.debug("Channel '%s' has %s human members", channel.name, human_count)
+        return human_count
+
+    def _get_voice_channels(self, guild: discord.Guild) -> List[discord.VoiceChannel]:
+        """Get the guild's voice channels, building the list once until channels change."""
+        channels = self._vc_cache.get(guild.id)
+        if channels is None:
+            channels = self._vc_cache[guild.id] = guild.voice_channels
+        return channels
+
+    def _get_human_counts(self, guild: discord.Guild) -> Dict[int, int]:
+        """Get per-channel human member counts for a guild, scanning it once on first use."""
+        counts = self._human_counts.get(guild.id)
+        if counts is None:
+            counts = {channel.id: self._count_human_members(channel) for channel in self._get_voice_channels(guild)}
+            self._human_counts[guild.id] = counts
+        return counts
+
+    def _update_human_counts(self, guild: discord.Guild,
+                             before_channel: Optional[discord.abc.GuildChannel],
+                             after_channel: Optional[discord.abc.GuildChannel]) -> None:
+        """Apply a human member's channel transition to the cached counts."""
+        counts = self._human_counts.get(guild.id)
+        if counts is None:
+            # Guild not scanned yet - the first scan will pick up the current state
+            return
+        if before_channel is not None:
+            counts[before_channel.id] = max(counts.get(before_channel.id, 0) - 1, 0)
+        if after_channel is not None:
+            counts[after_channel.id] = counts.get(after_channel.id, 0) + 1
 
     def _is_monitoring_guild(self, guild: discord.Guild) -> bool:
         """Check if the bot should monitor this guild."""
         return True
 
+    def _can_play_audio(self, guild: discord.Guild) -> bool:
+        """Check if the bot is connected to a voice channel in this guild."""
+        voice_client = guild.voice_client
+        return voice_client is not None and voice_client.is_connected()
+
     def _get_cooldown_seconds(self) -> float:
         """Get the configured salute cooldown in seconds."""
         env_val = os.getenv('SALUTE_COOLDOWN_SECONDS')
@@ -204,18 +440,23 @@ class BellboyBot(discord.Client):
             guild: Discord guild where the audio should be played
             **kwargs: Additional parameters for message formatting
         """
+        safe_guild_name = self._safe_guild_name(guild)
         try:
+            # Nothing to play into - don't synthesize audio that would be discarded
+            if not self._can_play_audio(guild):
+                self.logger.debug("[%s] Not connected, skipping TTS for message: %s", safe_guild_name, message_type)
+                return
+
             # Check if TTS is available
             if not self.tts_manager or not self.tts_manager.is_available:
-                self.logger.debug(f"[{self._safe_guild_name(guild)}] TTS not available for message: {message_type}")
+                self.logger.debug("[%s] TTS not available for message: %s", safe_guild_name, message_type)
                 return
 
             # Check per-user cooldown
             member_id = kwargs.get('member_id')
             if member_id and self._is_on_cooldown(member_id):
-                self.logger.debug(
-                    f"[{self._safe_guild_name(guild)}] Skipping salute for {kwargs.get('display_name', member_id)}: on cooldown"
-                )
+                self.logger.debug("[%s] Skipping salute for %s: on cooldown",
+                                  safe_guild_name, kwargs.get('display_name', member_id))
                 return
 
             # Resolve the message text first (random pick happens here)
@@ -226,21 +467,70 @@ class BellboyBot(discord.Client):
             # Cache path is based on the actual text so each variant is cached separately
             cache_path = self.tts_manager.generate_cache_path(text, prefix=f"msg_{message_type}")
 
-            self.logger.debug(f"[{self._safe_guild_name(guild)}] TTS request: {message_type} for {kwargs.get('display_name', 'Unknown')}")
+            self.logger.debug("[%s] TTS request: %s for %s",
+                              safe_guild_name, message_type, kwargs.get('display_name', 'Unknown'))
 
-            success = await self.tts_manager.synthesize_text(text, cache_path)
+            success = await self._synthesize_live(text, cache_path)
 
             if success:
                 if member_id:
                     self._update_cooldown(member_id)
                 await self.play_notification_audio(cache_path, guild)
             else:
-                safe_guild_name = self._safe_guild_name(guild)
-                self.logger.error(f"[{safe_guild_name}] Failed to create TTS for message type: {message_type}")
+                self.logger.error("[%s] Failed to create TTS for message type: %s", safe_guild_name, message_type)
 
         except Exception as e:
-            safe_guild_name = self._safe_guild_name(guild)
-            self.logger.error(f"[{safe_guild_name}] Error in create_and_play_tts: {e}")
+            self.logger.error("[%s] Error in create_and_play_tts: %s", safe_guild_name, e)
+
+    @newrelic.agent.function_trace()
+    async def create_and_play_group_tts(self, message_type: str, guild: discord.Guild,
+                                        members: List[Tuple[int, str]]) -> None:
+        """
+        Create a single TTS audio announcing several members and play it in the current voice channel.
+
+        Args:
+            message_type: The type of message (join, leave, move)
+            guild: Discord guild where the audio should be played
+            members: (member_id, display_name) pairs, in announcement order
+        """
+        safe_guild_name = self._safe_guild_name(guild)
+        try:
+            # Nothing to play into - don't synthesize audio that would be discarded
+            if not self._can_play_audio(guild):
+                self.logger.debug("[%s] Not connected, skipping TTS for message: %s", safe_guild_name, message_type)
+                return
+
+            # Check if TTS is available
+            if not self.tts_manager or not self.tts_manager.is_available:
+                self.logger.debug("[%s] TTS not available for message: %s", safe_guild_name, message_type)
+                return
+
+            # Members on cooldown are left out of the group
+            members = [(member_id, name) for member_id, name in members if not self._is_on_cooldown(member_id)]
+            if len(members) <= 1:
+                for member_id, display_name in members:
+                    await self.create_and_play_tts(message_type, guild, display_name=display_name, member_id=member_id)
+                return
+
+            text = self.tts_manager.get_group_message(message_type, [name for _, name in members])
+            if not text:
+                return
+
+            cache_path = self.tts_manager.generate_cache_path(text, prefix=f"msg_{message_type}")
+
+            self.logger.debug("[%s] TTS request: %s for %s members", safe_guild_name, message_type, len(members))
+
+            success = await self._synthesize_live(text, cache_path)
+
+            if success:
+                for member_id, _ in members:
+                    self._update_cooldown(member_id)
+                await self.play_notification_audio(cache_path, guild)
+            else:
+                self.logger.error("[%s] Failed to create TTS for message type: %s", safe_guild_name, message_type)
+
+        except Exception as e:
+            self.logger.error("[%s] Error in create_and_play_group_tts: %s", safe_guild_name, e)
 
     @newrelic.agent.function_trace()
     async def create_tts_from_text(self, text: str, guild: discord.Guild, **kwargs) -> None:
@@ -252,30 +542,34 @@ class BellboyBot(discord.Client):
             guild: Discord guild where the audio should be played
             **kwargs: Additional parameters for TTS synthesis
         """
+        safe_guild_name = self._safe_guild_name(guild)
         try:
+            # Nothing to play into - don't synthesize audio that would be discarded
+            if not self._can_play_audio(guild):
+                self.logger.debug("[%s] Not connected, skipping TTS for text", safe_guild_name)
+                return
+
             # Check if TTS is available
             if not self.tts_manager or not self.tts_manager.is_available:
-                self.logger.debug(f"[{self._safe_guild_name(guild)}] TTS not available for text: {text}")
+                self.logger.debug("[%s] TTS not available for text: %s", safe_guild_name, text)
                 return
 
             # Generate a unique cache path for this text
             cache_path = self.tts_manager.generate_cache_path(text, prefix="custom")
 
             # Create the TTS audio
-            success = await self.tts_manager.synthesize_text(text, cache_path, **kwargs)
+            success = await self._synthesize_live(text, cache_path, **kwargs)
 
             if success:
                 # Play the generated TTS audio
                 await self.play_notification_audio(cache_path, guild)
             else:
-                safe_guild_name = self._safe_guild_name(guild)
-                self.logger.error(f"[{safe_guild_name}] Failed to create TTS for text: {text}")
+                self.logger.error("[%s] Failed to create TTS for text: %s", safe_guild_name, text)
 
         except Exception as e:
-            safe_guild_name = self._safe_guild_name(guild)
-            self.logger.error(f"[{safe_guild_name}] Error in create_tts_from_text: {e}")
+            self.logger.error("[%s] Error in create_tts_from_text: %s", safe_guild_name, e)
 
-    async def find_busiest_voice_channel(self, guild: discord.Guild) -> Tuple[Optional[discord.VoiceChannel], int]:
+    def find_busiest_voice_channel(self, guild: discord.Guild) -> Tuple[Optional[discord.VoiceChannel], int]:
         """
         Find the voice channel with the most human members.
         Ignores the channel specified in IGNORED_CHANNEL_ID environment variable.
@@ -286,14 +580,17 @@ class BellboyBot(discord.Client):
         """
         busiest_channel = None
         max_members = 0
+        counts = self._get_human_counts(guild)
 
-        for channel in guild.voice_channels:
+        for channel in self._get_voice_channels(guild):
             # Skip the ignored channel if it's configured
-            if IGNORED_CHANNEL_ID and str(channel.id) == IGNORED_CHANNEL_ID:
-                self.logger.debug(f"[{self._safe_guild_name(guild)}] Skipping ignored channel: {channel.name} (ID: {channel.id})")
+            if channel.id == IGNORED_CHANNEL_ID_INT:
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("[%s] Skipping ignored channel: %s (ID: %s)",
+                                      self._safe_guild_name(guild), channel.name, channel.id)
                 continue
-                
-            member_count = self._count_human_members(channel)
+
+            member_count = counts.get(channel.id, 0)
             if member_count > max_members:
                 max_members = member_count
                 busiest_channel = channel
@@ -303,148 +600,419 @@ class BellboyBot(discord.Client):
     @newrelic.agent.function_trace()
     async def play_notification_audio(self, audio_path: str, guild: discord.Guild) -> None:
         """
-        Play notification audio in the voice channel if bot is connected.
+        Queue notification audio for playback in the voice channel if bot is connected.
+        Notifications for the same guild play one after another.
 
         Args:
-            audio_path: Path to the MP3 file to play
+            audio_path: Path to the audio file (MP3 or WAV) to play
             guild: Discord guild where the bot should play audio
         """
+        safe_guild_name = self._safe_guild_name(guild)
         try:
-            # Add custom attributes for monitoring
-            newrelic.agent.add_custom_attributes({
-                'audio.path': audio_path,
-                'guild.id': guild.id,
-                'guild.name': self._safe_guild_name(guild)
-            })
+            if NR_ENABLED:
+                # Add custom attributes for monitoring
+                newrelic.agent.add_custom_attributes({
+                    'audio.path': audio_path,
+                    'guild.id': guild.id,
+                    'guild.name': safe_guild_name
+                })
 
             # Record audio playback attempt
-            newrelic.agent.record_custom_metric('Custom/Audio/PlaybackAttempts', 1)
+            self._metric_counts['Custom/Audio/PlaybackAttempts'] += 1
 
             # Check if bot is connected to a voice channel
             if not guild.voice_client or not guild.voice_client.is_connected():
-                newrelic.agent.record_custom_metric('Custom/Audio/NotConnected', 1)
+                self._metric_counts['Custom/Audio/NotConnected'] += 1
                 return
 
-            # Check if audio file exists
-            if not os.path.exists(audio_path):
-                newrelic.agent.record_custom_metric('Custom/Audio/FileNotFound', 1)
-                safe_guild_name = self._safe_guild_name(guild)
-                self.logger.warning(f"[{safe_guild_name}] Audio file not found: {audio_path}")
+            # Check if audio file exists and isn't empty. Clips already encoded in memory, tracked by the
+            # TTS cache or verified before are known to be good; anything else is stat'ed once in a
+            # worker thread so a slow volume can't stall the loop
+            known_path = audio_path in self._verified_audio_paths or audio_path in self._opus_cache or (
+                self.tts_manager is not None and audio_path in self.tts_manager.cache_manager.cache
+            )
+            if not known_path:
+                if not await asyncio.to_thread(_is_playable_file, audio_path):
+                    self._metric_counts['Custom/Audio/FileNotFound'] += 1
+                    self.logger.warning("[%s] Audio file missing or empty: %s", safe_guild_name, audio_path)
+                    return
+                self._verified_audio_paths.add(audio_path)
+
+            # Encode once, then replay repeated clips from memory
+            packets = await self._get_opus_packets(audio_path)
+
+            # Queue behind any notification already playing instead of dropping it
+            audio_queue = self._audio_queues.get(guild.id)
+            if audio_queue is None:
+                audio_queue = self._audio_queues[guild.id] = asyncio.Queue(maxsize=AUDIO_QUEUE_MAX_SIZE)
+            try:
+                audio_queue.put_nowait((audio_path, packets))
+            except asyncio.QueueFull:
+                self._metric_counts['Custom/Audio/QueueFull'] += 1
+                self.logger.warning("[%s] Audio queue full, dropping notification", safe_guild_name)
                 return
 
-            # Don't interrupt if already playing audio
-            if guild.voice_client.is_playing():
-                newrelic.agent.record_custom_metric('Custom/Audio/AlreadyPlaying', 1)
-                return
+            worker = self._audio_workers.get(guild.id)
+            if worker is None or worker.done():
+                self._audio_workers[guild.id] = asyncio.create_task(self._audio_worker(guild, audio_queue))
+
+        except Exception as e:
+            self._metric_counts['Custom/Audio/GeneralError'] += 1
+            newrelic.agent.notice_error()
+            self.logger.error("[%s] Error playing notification audio: %s", safe_guild_name, e)
+
+    async def _audio_worker(self, guild: discord.Guild, audio_queue: asyncio.Queue) -> None:
+        """Play queued notifications for a guild one after another."""
+        safe_guild_name = self._safe_guild_name(guild)
+        loop = asyncio.get_running_loop()
+
+        while True:
+            audio_path, packets = await audio_queue.get()
+
+            voice_client = guild.voice_client
+            if not voice_client or not voice_client.is_connected():
+                self._metric_counts['Custom/Audio/NotConnected'] += 1
+                continue
+
+            finished = loop.create_future()
+
+            # The future is bound now: a clip stopped on timeout may call back after the next one started
+            def after_playing(error: Optional[Exception], fut: asyncio.Future = finished,
+                              path: str = audio_path, streamed: bool = not packets) -> None:
+                # Runs on discord.py's player thread
+                if error:
+                    self.logger.error('Audio player error: %s', error)
+                    if streamed:
+                        # FFmpeg read the file itself - it may have been deleted or truncated since it was verified
+                        loop.call_soon_threadsafe(self._forget_audio_path, path)
+                loop.call_soon_threadsafe(self._resolve_playback, fut)
 
-            # Create audio source and play
             try:
-                audio_source = discord.FFmpegPCMAudio(audio_path, **FFMPEG_OPTIONS)
-                guild.voice_client.play(
-                    audio_source,
-                    after=lambda e: self.logger.error(f'Audio player error: {e}') if e else None
-                )
+                if packets:
+                    audio_source = CachedOpusAudio(packets)
+                elif audio_path.endswith('.opus'):
+                    audio_source = _make_opus_copy_source(audio_path)
+                else:
+                    audio_source = _make_audio_source(audio_path)
+                voice_client.play(audio_source, after=after_playing)
 
-                safe_guild_name = self._safe_guild_name(guild)
-                self.logger.debug(f"[{safe_guild_name}] Playing notification audio")
-                newrelic.agent.record_custom_metric('Custom/Audio/PlaybackSuccess', 1)
+                self.logger.debug("[%s] Playing notification audio", safe_guild_name)
+                self._metric_counts['Custom/Audio/PlaybackSuccess'] += 1
 
             except discord.errors.ClientException as e:
-                newrelic.agent.record_custom_metric('Custom/Audio/DiscordClientError', 1)
+                self._metric_counts['Custom/Audio/DiscordClientError'] += 1
                 newrelic.agent.notice_error()
-                safe_guild_name = self._safe_guild_name(guild)
-                self.logger.error(f"[{safe_guild_name}] Discord client error playing audio: {e}")
+                self.logger.error("[%s] Discord client error playing audio: %s", safe_guild_name, e)
+                continue
             except Exception as e:
-                newrelic.agent.record_custom_metric('Custom/Audio/FFmpegError', 1)
+                self._metric_counts['Custom/Audio/FFmpegError'] += 1
+                self._forget_audio_path(audio_path)
                 newrelic.agent.notice_error()
-                safe_guild_name = self._safe_guild_name(guild)
-                self.logger.error(f"[{safe_guild_name}] FFmpeg error playing audio: {e}")
+                self.logger.error("[%s] FFmpeg error playing audio: %s", safe_guild_name, e)
+                continue
 
+            # Wait for this clip to finish before starting the next one
+            try:
+                await asyncio.wait_for(finished, timeout=AUDIO_PLAYBACK_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                self.logger.warning("[%s] Notification audio did not finish in time, stopping it", safe_guild_name)
+                voice_client.stop()
+
+    def _forget_audio_path(self, audio_path: str) -> None:
+        """Stop trusting an audio file that failed to play, so it is stat'ed again next time."""
+        # The error may be a voice socket failure rather than a bad file, so the file itself is kept;
+        # the next play re-checks it and the next synthesis request re-validates (or regenerates) it
+        self._verified_audio_paths.discard(audio_path)
+        if self.tts_manager is not None:
+            self.tts_manager.cache_manager.untrack(audio_path)
+
+    @staticmethod
+    def _resolve_playback(fut: asyncio.Future) -> None:
+        """Mark a clip's playback as finished, unless its wait already ended."""
+        if not fut.done():
+            fut.set_result(None)
+
+    async def _get_opus_packets(self, audio_path: str) -> Optional[List[bytes]]:
+        """Get the Opus packets for an audio file, encoding and caching them on first use."""
+        packets = self._opus_cache.get(audio_path)
+        if packets is not None:
+            self._opus_cache.move_to_end(audio_path)
+            return packets
+
+        try:
+            packets = await asyncio.to_thread(_encode_opus_packets, audio_path)
         except Exception as e:
-            newrelic.agent.record_custom_metric('Custom/Audio/GeneralError', 1)
-            newrelic.agent.notice_error()
-            safe_guild_name = self._safe_guild_name(guild)
-            self.logger.error(f"[{safe_guild_name}] Error playing notification audio: {e}")
+            # Fall back to streaming the file through FFmpeg at play time
+            self.logger.warning("Could not pre-encode %s: %s", os.path.basename(audio_path), e)
+            return None
 
-    async def join_busiest_channel_if_needed(self, guild: discord.Guild) -> None:
-        """Join the busiest voice channel if bot is not already there."""
+        self._opus_cache[audio_path] = packets
+        if len(self._opus_cache) > OPUS_CACHE_MAX_ENTRIES:
+            self._opus_cache.popitem(last=False)
+        return packets
+
+    async def join_busiest_channel_if_needed(self, guild: discord.Guild) -> bool:
+        """
+        Join the busiest voice channel if bot is not already there.
+
+        Returns:
+            True if the bot ends up in a channel with human members
+        """
+        safe_guild_name = self._safe_guild_name(guild)
         try:
-            busiest_channel, max_members = await self.find_busiest_voice_channel(guild)
+            busiest_channel, max_members = self.find_busiest_voice_channel(guild)
 
             # Only proceed if there are users in voice channels
             if not busiest_channel or max_members == 0:
-                return
+                return False
 
             # If bot is not connected, join the busiest channel
             if not guild.voice_client:
                 await busiest_channel.connect()
-                safe_guild_name = self._safe_guild_name(guild)
-                self.logger.info(f"[{safe_guild_name}] Bot joined busiest channel: {busiest_channel.name} ({max_members} members)")
-                return
+                self.logger.info("[%s] Bot joined busiest channel: %s (%s members)", safe_guild_name, busiest_channel.name, max_members)
+                return True
 
             # If bot is connected but not in the busiest channel, move there
             current_channel = guild.voice_client.channel
             if current_channel != busiest_channel:
                 await guild.voice_client.move_to(busiest_channel)
-                safe_guild_name = self._safe_guild_name(guild)
-                self.logger.info(f"[{safe_guild_name}] Bot moved to busier channel: {busiest_channel.name} ({max_members} members)")
+                self.logger.info("[%s] Bot moved to busier channel: %s (%s members)", safe_guild_name, busiest_channel.name, max_members)
+            return True
 
         except discord.ClientException as e:
-            safe_guild_name = self._safe_guild_name(guild)
-            self.logger.error(f"[{safe_guild_name}] Discord client error joining voice channel: {e}")
+            self.logger.error("[%s] Discord client error joining voice channel: %s", safe_guild_name, e)
         except Exception as e:
-            safe_guild_name = self._safe_guild_name(guild)
-            self.logger.error(f"[{safe_guild_name}] Unexpected error joining voice channel: {e}")
+            self.logger.error("[%s] Unexpected error joining voice channel: %s", safe_guild_name, e)
+        return False
 
     async def leave_if_empty(self, guild: discord.Guild) -> None:
         """Leave voice channel if no human members are present."""
+        safe_guild_name = self._safe_guild_name(guild)
         try:
             # Check if bot is connected
             if not guild.voice_client or not guild.voice_client.is_connected():
-                self.logger.debug(f"[{self._safe_guild_name(guild)}] Bot not connected to any voice channel")
+                self.logger.debug("[%s] Bot not connected to any voice channel", safe_guild_name)
                 return
 
             current_channel = guild.voice_client.channel
 
-            # Add a small delay to ensure discord state is updated
-            import asyncio
-            await asyncio.sleep(0.5)
-
+            # No settle delay needed: discord.py applies the voice state to its cache
+            # before dispatching on_voice_state_update, so channel.members is current
             human_count = self._count_human_members(current_channel)
 
-            safe_guild_name = self._safe_guild_name(guild)
-            self.logger.debug(f"[{safe_guild_name}] Checking if should leave {current_channel.name}: {human_count} human members")
+            self.logger.debug("[%s] Checking if should leave %s: %s human members", safe_guild_name, current_channel.name, human_count)
 
             # Leave if no human members
             if human_count == 0:
                 await guild.voice_client.disconnect()
-                self.logger.info(f"[{safe_guild_name}] Bot left empty channel: {current_channel.name}")
+                self.logger.info("[%s] Bot left empty channel: %s", safe_guild_name, current_channel.name)
             else:
-                self.logger.debug(f"[{safe_guild_name}] Staying in {current_channel.name} with {human_count} human members")
+                self.logger.debug("[%s] Staying in %s with %s human members", safe_guild_name, current_channel.name, human_count)
 
         except Exception as e:
-            safe_guild_name = self._safe_guild_name(guild)
-            self.logger.error(f"[{safe_guild_name}] Error checking if should leave empty channel: {e}")
-
-    def _wrap_discord_event(self, event_name: str):
-        """Decorator to wrap Discord events as New Relic transactions."""
-        def decorator(func):
-            async def wrapper(*args, **kwargs):
-                with newrelic.agent.BackgroundTask(application=newrelic.agent.application(), name=f'Discord.{event_name}'):
-                    return await func(*args, **kwargs)
-            return wrapper
-        return decorator
+            self.logger.error("[%s] Error checking if should leave empty channel: %s", safe_guild_name, e)
+
+    def _schedule_reconcile(self, guild: discord.Guild) -> None:
+        """Schedule a debounced join/leave re-evaluation for the guild, replacing any pending one."""
+        pending = self._reconcile_tasks.get(guild.id)
+        if pending:
+            pending.cancel()
+        self._reconcile_tasks[guild.id] = asyncio.create_task(
+            self._debounced_reconcile(guild, RECONCILE_DEBOUNCE_SECONDS)
+        )
+
+    def _schedule_announcement(self, guild: discord.Guild, action: str, member: discord.Member) -> None:
+        """Queue an announcement and (re)start the guild's quiet-period timer."""
+        pending = self._pending_announcements.setdefault(guild.id, {})
+        # Only a member's latest transition in the burst is announced, in order of last activity
+        pending.pop(member.id, None)
+        pending[member.id] = (action, member.display_name)
+
+        task = self._announce_tasks.get(guild.id)
+        if task:
+            task.cancel()
+        self._announce_tasks[guild.id] = asyncio.create_task(
+            self._debounced_announce(guild, ANNOUNCE_DEBOUNCE_SECONDS)
+        )
+
+    async def _debounced_announce(self, guild: discord.Guild, delay: float) -> None:
+        """Wait for voice activity to settle, then announce each member's latest transition."""
+        await asyncio.sleep(delay)
+        # Let the bot join/move first, otherwise the first member into an idle guild is never greeted
+        await self._wait_for_reconcile(guild)
+
+        # Past the quiet period - detach and take the burst, later events start a new one
+        if self._announce_tasks.get(guild.id) is asyncio.current_task():
+            del self._announce_tasks[guild.id]
+        pending = self._pending_announcements.pop(guild.id, None)
+        if not pending or not self._can_play_audio(guild):
+            return
+
+        # Members with the same transition are announced together in a single clip
+        groups: Dict[str, List[Tuple[int, str]]] = {}
+        for member_id, (action, display_name) in pending.items():
+            groups.setdefault(action, []).append((member_id, display_name))
+        for action, members in groups.items():
+            if len(members) == 1:
+                member_id, display_name = members[0]
+                await self.create_and_play_tts(action, guild, display_name=display_name, member_id=member_id)
+            else:
+                await self.create_and_play_group_tts(action, guild, members)
+
+        # Members still around will likely move or leave next - render those clips ahead of time
+        self._schedule_prewarm(
+            (member_id, display_name) for member_id, (action, display_name) in pending.items() if action != 'leave'
+        )
+
+    def _schedule_prewarm(self, members) -> None:
+        """
+        Pre-synthesize leave/move clips in the background for members not seen before.
+
+        Args:
+            members: Iterable of (member_id, display_name) pairs
+        """
+        if not self.tts_manager or not self.tts_manager.is_available or not self.tts_manager.prewarm_enabled:
+            return
+        new_members = [(member_id, name) for member_id, name in members if member_id not in self._prewarmed_members]
+        if not new_members:
+            return
+        for member_id, _ in new_members:
+            self._prewarmed_members[member_id] = None
+        while len(self._prewarmed_members) > PREWARM_MAX_MEMBERS:
+            self._prewarmed_members.popitem(last=False)
+
+        task = asyncio.create_task(self._prewarm_tts(new_members))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _prewarm_tts(self, members: List[Tuple[int, str]]) -> None:
+        """Synthesize every leave/move message variant for the given members that isn't cached yet."""
+        # One prewarm at a time, one clip at a time
+        async with self._prewarm_lock:
+            for member_id, display_name in members:
+                try:
+                    for message_type in PREWARM_ACTIONS:
+                        for text in self.tts_manager.get_message_variants(message_type, display_name=display_name, member_id=member_id):
+                            cache_path = self.tts_manager.generate_cache_path(text, prefix=f"msg_{message_type}")
+                            if await self._synthesize_background(text, cache_path):
+                                await asyncio.sleep(PREWARM_CLIP_INTERVAL_SECONDS)
+                except Exception as e:
+                    # Skip to the next member rather than abandoning the whole batch
+                    self.logger.warning("Pre-synthesis failed for %s: %s", display_name, e)
+
+    async def _synthesize_background(self, text: str, cache_path: str) -> bool:
+        """Render a clip once no live announcement needs the model, returning whether anything was rendered."""
+        while True:
+            await self._live_synthesis_idle.wait()
+            async with self._synthesis_lock:
+                # A live announcement queued up while this waited for the lock - let it go first
+                if self._live_synthesis_count:
+                    continue
+                if cache_path in self.tts_manager.cache_manager.cache:
+                    return False
+                await self.tts_manager.synthesize_text(text, cache_path)
+                return True
+
+    async def _synthesize_live(self, text: str, cache_path: str, **kwargs) -> bool:
+        """Synthesize an announcement that is about to be played, ahead of any background renders."""
+        # Cache hits don't touch the model, so they don't wait for the lock
+        if cache_path in self.tts_manager.cache_manager.cache:
+            return await self.tts_manager.synthesize_text(text, cache_path, **kwargs)
+
+        self._live_synthesis_count += 1
+        self._live_synthesis_idle.clear()
+        try:
+            async with self._synthesis_lock:
+                return await self.tts_manager.synthesize_text(text, cache_path, **kwargs)
+        finally:
+            self._live_synthesis_count -= 1
+            if not self._live_synthesis_count:
+                self._live_synthesis_idle.set()
+
+    async def _debounced_reconcile(self, guild: discord.Guild, delay: float) -> None:
+        """Wait for voice activity to settle, then move to the busiest channel or leave, once."""
+        await asyncio.sleep(delay)
+
+        # Past the quiet period - detach so a newer event schedules a fresh task
+        # instead of cancelling this one in the middle of a connect/move/disconnect
+        if self._reconcile_tasks.get(guild.id) is asyncio.current_task():
+            del self._reconcile_tasks[guild.id]
+
+        # A detached reconcile may still be mid-connect - wait for it, then act on the latest state.
+        # Joining and leaving both drive the same voice client, so they can't run concurrently;
+        # once the bot is in the (non-empty) busiest channel there is nothing left to check
+        async with self._voice_lock(guild):
+            # The bot may have left the guild while this reconcile was waiting
+            if self.get_guild(guild.id) is None:
+                return
+            if not await self.join_busiest_channel_if_needed(guild):
+                await self.leave_if_empty(guild)
+
+    async def _wait_for_reconcile(self, guild: discord.Guild) -> None:
+        """Wait until no join/leave re-evaluation is pending or running for the guild."""
+        # A pending reconcile is replaced (not just cancelled) by newer events, so follow the chain
+        while (reconcile := self._reconcile_tasks.get(guild.id)) is not None:
+            await asyncio.wait({reconcile})
+        # A detached reconcile holds the voice lock until its connect/move/disconnect is done
+        async with self._voice_lock(guild):
+            pass
+
+    def _voice_lock(self, guild: discord.Guild) -> asyncio.Lock:
+        """Get the lock serializing voice connection changes for the guild."""
+        lock = self._voice_locks.get(guild.id)
+        if lock is None:
+            lock = self._voice_locks[guild.id] = asyncio.Lock()
+        return lock
+
+    async def setup_hook(self) -> None:
+        """Start background tasks once the event loop is running."""
+        self._metrics_task = asyncio.create_task(self._flush_metrics_periodically())
+
+    async def close(self) -> None:
+        """Stop background tasks and flush pending metrics before shutting down."""
+        if self._metrics_task is not None:
+            self._metrics_task.cancel()
+        for worker in self._audio_workers.values():
+            worker.cancel()
+        self._audio_workers.clear()
+        self._flush_metrics()
+        await super().close()
+
+    async def _flush_metrics_periodically(self) -> None:
+        """Report aggregated event counters to New Relic every few seconds."""
+        while True:
+            await asyncio.sleep(METRICS_FLUSH_INTERVAL_SECONDS)
+            self._flush_metrics()
+
+    def _flush_metrics(self) -> None:
+        """Send all pending counters to New Relic in one call and reset them."""
+        if not self._metric_counts:
+            return
+        if self._nr_app is None:
+            self._metric_counts.clear()
+            return
+        # Sent as pre-aggregated stats of N value-1 samples, so call_count/average read as if each
+        # event had been recorded individually
+        metrics = [
+            (name, {'count': n, 'total': n, 'min': 1, 'max': 1, 'sum_of_squares': n})
+            for name, n in self._metric_counts.items()
+        ]
+        self._metric_counts.clear()
+        newrelic.agent.record_custom_metrics(metrics, application=self._nr_app)
 
     @newrelic.agent.background_task(name='Discord.on_ready')
     async def on_ready(self):
         """Called when the bot is ready."""
-        self.logger.info(f'Bot logged in as {self.user} (ID: {self.user.id})')
+        self.logger.info('Bot logged in as %s (ID: %s)', self.user, self.user.id)
+        self._bot_user_id = self.user.id
+
+        # (Re)connected - discard cached channel state, it is rebuilt lazily
+        self._human_counts.clear()
+        self._vc_cache.clear()
 
         # Initialize TTS manager asynchronously with timeout
         if self.tts_manager:
             try:
-                import asyncio
-
                 self.logger.info("Initializing TTS Manager (this may take time on first run)...")
 
                 # Add timeout to prevent blocking Discord connection
@@ -454,15 +1022,15 @@ class BellboyBot(discord.Client):
                 )
 
                 if tts_success:
-                    self.logger.info(f"TTS Manager initialized successfully with provider: {TTS_PROVIDER}")
+                    self.logger.info("TTS Manager initialized successfully with provider: %s", TTS_PROVIDER)
 
                     # Log cache statistics
                     if self.tts_manager.cache_manager:
                         cache_stats = self.tts_manager.cache_manager.get_cache_stats()
                         self.logger.info(
-                            f"TTS Cache: {cache_stats['current_files']} files, "
-                            f"{cache_stats['total_size_mb']}MB/{cache_stats['max_size_mb']:.0f}MB "
-                            f"({cache_stats['usage_percent']}%)"
+                            "TTS Cache: %s files, %sMB/%.0fMB (%s%%)",
+                            cache_stats['current_files'], cache_stats['total_size_mb'],
+                            cache_stats['max_size_mb'], cache_stats['usage_percent']
                         )
                 else:
                     self.logger.warning("TTS Manager initialization failed - TTS functionality disabled")
@@ -474,7 +1042,7 @@ class BellboyBot(discord.Client):
                 self.logger.warning("TTS functionality disabled - bot will continue without voice announcements")
                 self.tts_manager = None
             except Exception as e:
-                self.logger.error(f"Error initializing TTS Manager: {e}")
+                self.logger.error("Error initializing TTS Manager: %s", e)
                 self.logger.warning("TTS functionality disabled - bot will continue without voice announcements")
                 self.tts_manager = None
 
@@ -489,55 +1057,73 @@ class BellboyBot(discord.Client):
             # Record startup voice channel check
             newrelic.agent.record_custom_metric('Custom/Bot/StartupChannelCheck', 1)
 
-            for guild in self.guilds:
-                try:
-                    # Skip if not monitoring this guild
-                    if not self._is_monitoring_guild(guild):
-                        continue
-
-                    safe_guild_name = self._safe_guild_name(guild)
-
-                    # Find the busiest voice channel
-                    busiest_channel, max_members = await self.find_busiest_voice_channel(guild)
-
-                    # Join if there are users in voice channels and bot is not connected
-                    if busiest_channel and max_members > 0 and not guild.voice_client:
-                        try:
-                            await busiest_channel.connect()
-                            self.logger.info(f"[{safe_guild_name}] Bot joined channel on startup: {busiest_channel.name} ({max_members} members)")
-                            newrelic.agent.record_custom_metric('Custom/Bot/StartupChannelJoin', 1)
-                        except discord.ClientException as e:
-                            self.logger.error(f"[{safe_guild_name}] Failed to join channel on startup: {e}")
-                            newrelic.agent.record_custom_metric('Custom/Bot/StartupChannelJoinError', 1)
-                    elif busiest_channel and max_members > 0:
-                        self.logger.info(f"[{safe_guild_name}] Found active channel on startup: {busiest_channel.name} ({max_members} members) - already connected")
-                    else:
-                        self.logger.debug(f"[{safe_guild_name}] No active voice channels found on startup")
+            # Connect to every guild concurrently so startup takes as long as the slowest guild
+            await asyncio.gather(
+                *(self._startup_one(guild) for guild in self.guilds if self._is_monitoring_guild(guild)),
+                return_exceptions=True
+            )
 
-                except Exception as e:
-                    safe_guild_name = self._safe_guild_name(guild)
-                    self.logger.error(f"[{safe_guild_name}] Error checking voice channels on startup: {e}")
-                    newrelic.agent.notice_error()
+        except Exception as e:
+            self.logger.error("Error during startup voice channel check: %s", e)
+            newrelic.agent.notice_error()
+
+    async def _startup_one(self, guild: discord.Guild) -> None:
+        """Join the busiest voice channel of a single guild on startup."""
+        safe_guild_name = self._safe_guild_name(guild)
+        try:
+            # Find the busiest voice channel
+            busiest_channel, max_members = self.find_busiest_voice_channel(guild)
+
+            if not busiest_channel or max_members == 0:
+                self.logger.debug("[%s] No active voice channels found on startup", safe_guild_name)
+                return
+
+            # Join if the bot is not connected - checked under the lock, a reconcile may have just connected
+            async with self._voice_lock(guild):
+                if not guild.voice_client:
+                    try:
+                        await busiest_channel.connect()
+                        self.logger.info("[%s] Bot joined channel on startup: %s (%s members)", safe_guild_name, busiest_channel.name, max_members)
+                        newrelic.agent.record_custom_metric('Custom/Bot/StartupChannelJoin', 1)
+                    except discord.ClientException as e:
+                        self.logger.error("[%s] Failed to join channel on startup: %s", safe_guild_name, e)
+                        newrelic.agent.record_custom_metric('Custom/Bot/StartupChannelJoinError', 1)
+                else:
+                    self.logger.info("[%s] Found active channel on startup: %s (%s members) - already connected", safe_guild_name, busiest_channel.name, max_members)
+
+            # Render the clips for members already present so their next move/leave is a cache hit -
+            # unless the bot couldn't connect, in which case nothing will be announced
+            if self._can_play_audio(guild):
+                self._schedule_prewarm(
+                    (member.id, member.display_name) for member in busiest_channel.members
+                    if self._is_human_member(member) and not self._is_ignored_user(member)
+                )
 
         except Exception as e:
-            self.logger.error(f"Error during startup voice channel check: {e}")
+            self.logger.error("[%s] Error checking voice channels on startup: %s", safe_guild_name, e)
             newrelic.agent.notice_error()
 
     @newrelic.agent.background_task(name='Discord.on_voice_state_update')
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
         """Called when a user's voice state changes."""
-        try:
-            # Add custom attributes for monitoring
-            newrelic.agent.add_custom_attributes({
-                'guild.id': member.guild.id,
-                'guild.name': self._safe_guild_name(member.guild),
-                'member.id': member.id,
-                'member.name': member.display_name,
-                'member.is_bot': member.bot
-            })
+        # Mute/deafen/stream/video toggles keep the member in the same channel and make up most
+        # updates; count them and return before any per-event monitoring or membership work
+        if before.channel is after.channel:
+            self._metric_counts['Custom/Discord/VoiceStateUpdates'] += 1
+            return
 
-            # Record voice activity metrics
-            newrelic.agent.record_custom_metric('Custom/Discord/VoiceStateUpdates', 1)
+        safe_guild_name = self._safe_guild_name(member.guild)
+        # Custom attributes for monitoring; transition handlers extend this and it is reported once
+        attrs = {
+            'guild.id': member.guild.id,
+            'guild.name': safe_guild_name,
+            'member.id': member.id,
+            'member.name': member.display_name,
+            'member.is_bot': member.bot
+        } if NR_ENABLED else {}
+        counts = self._metric_counts
+        try:
+            counts['Custom/Discord/VoiceStateUpdates'] += 1
 
             # Skip if not monitoring this guild
             if not self._is_monitoring_guild(member.guild):
@@ -545,67 +1131,94 @@ class BellboyBot(discord.Client):
 
             # Skip if it's not a human member (bots, apps, system users, etc.)
             if not self._is_human_member(member):
-                newrelic.agent.record_custom_metric('Custom/Discord/BotVoiceActivity', 1)
+                counts['Custom/Discord/BotVoiceActivity'] += 1
                 return
 
+            # Keep per-channel human counts in sync (ignored users still count as present)
+            self._update_human_counts(member.guild, before.channel, after.channel)
+
             # Skip ignored users
             if self._is_ignored_user(member):
-                self.logger.debug(f"[{self._safe_guild_name(member.guild)}] Ignoring voice activity for {member.id}")
+                self.logger.debug("[%s] Ignoring voice activity for %s", safe_guild_name, member.id)
                 return
 
             # Record human voice activity
-            newrelic.agent.record_custom_metric('Custom/Discord/HumanVoiceActivity', 1)
-
-            username = self._format_member_info(member)
-            safe_guild_name = self._safe_guild_name(member.guild)
-            guild = member.guild
-
-            # User joined a voice channel
-            if before.channel is None and after.channel is not None:
-                newrelic.agent.record_custom_metric('Custom/Discord/UserJoined', 1)
-                newrelic.agent.add_custom_attributes({
-                    'action': 'joined',
-                    'channel.name': after.channel.name
-                })
-
-                self.logger.info(f"[{safe_guild_name}] {username} joined voice channel: {after.channel.name}")
-                # Generate TTS audio for user joining
-                await self.create_and_play_tts('join', guild, display_name=member.display_name, member_id=member.id)
-                await self.join_busiest_channel_if_needed(guild)
-
-            # User left a voice channel
-            elif before.channel is not None and after.channel is None:
-                newrelic.agent.record_custom_metric('Custom/Discord/UserLeft', 1)
-                newrelic.agent.add_custom_attributes({
-                    'action': 'left',
-                    'channel.name': before.channel.name
-                })
-
-                self.logger.info(f"[{safe_guild_name}] {username} left voice channel: {before.channel.name}")
-                # Generate TTS audio for user leaving
-                await self.create_and_play_tts('leave', guild, display_name=member.display_name, member_id=member.id)
-                await self.leave_if_empty(guild)
+            counts['Custom/Discord/HumanVoiceActivity'] += 1
 
-            # User moved between voice channels
-            elif before.channel is not None and after.channel is not None and before.channel != after.channel:
-                newrelic.agent.record_custom_metric('Custom/Discord/UserMoved', 1)
-                newrelic.agent.add_custom_attributes({
-                    'action': 'moved',
-                    'from_channel.name': before.channel.name,
-                    'to_channel.name': after.channel.name
-                })
-
-                self.logger.info(f"[{safe_guild_name}] {username} moved from {before.channel.name} to {after.channel.name}")
-                # Generate TTS audio for user moving
-                await self.create_and_play_tts('move', guild, display_name=member.display_name, member_id=member.id)
-                await self.join_busiest_channel_if_needed(guild)
-                await self.leave_if_empty(guild)
+            action = VOICE_TRANSITIONS[(before.channel is None, after.channel is None)]
+            await self._handle_transition(action, member, before.channel, after.channel, safe_guild_name, attrs)
 
         except Exception as e:
-            newrelic.agent.record_custom_metric('Custom/Discord/VoiceStateUpdateErrors', 1)
+            counts['Custom/Discord/VoiceStateUpdateErrors'] += 1
             newrelic.agent.notice_error()
-            safe_guild_name = self._safe_guild_name(member.guild)
-            self.logger.error(f"[{safe_guild_name}] Error in voice state update: {e}")
+            self.logger.error("[%s] Error in voice state update: %s", safe_guild_name, e)
+        finally:
+            if NR_ENABLED:
+                newrelic.agent.add_custom_attributes(attrs)
+
+    async def _handle_transition(self, action: str, member: discord.Member,
+                                 before_channel: Optional[discord.VoiceChannel],
+                                 after_channel: Optional[discord.VoiceChannel],
+                                 safe_guild_name: str, attrs: dict) -> None:
+        """Handle a user joining, leaving or moving between voice channels."""
+        guild = member.guild
+        verb, metric, log_format = VOICE_ACTIONS[action]
+        self._metric_counts[metric] += 1
+
+        # The channel(s) involved: after for a join, before for a leave, both for a move
+        channel_names = tuple(channel.name for channel in (before_channel, after_channel) if channel is not None)
+        attrs['action'] = verb
+        if len(channel_names) == 1:
+            attrs['channel.name'] = channel_names[0]
+        else:
+            attrs['from_channel.name'], attrs['to_channel.name'] = channel_names
+
+        # Member info is only formatted when INFO records are actually emitted
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(log_format, safe_guild_name, self._format_member_info(member), *channel_names)
+        # Follow the crowd in the background and announce the transition once the burst settles
+        self._schedule_reconcile(guild)
+        self._schedule_announcement(guild, action, member)
+
+    async def on_guild_update(self, before: discord.Guild, after: discord.Guild):
+        """Called when a guild is updated; drop its cached name."""
+        self._guild_name_cache.pop(after.id, None)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Called when the bot leaves a guild; drop its cached state."""
+        self._guild_name_cache.pop(guild.id, None)
+        self._human_counts.pop(guild.id, None)
+        self._vc_cache.pop(guild.id, None)
+        self._voice_locks.pop(guild.id, None)
+        reconcile = self._reconcile_tasks.pop(guild.id, None)
+        if reconcile:
+            reconcile.cancel()
+        self._audio_queues.pop(guild.id, None)
+        worker = self._audio_workers.pop(guild.id, None)
+        if worker:
+            worker.cancel()
+        self._pending_announcements.pop(guild.id, None)
+        announce = self._announce_tasks.pop(guild.id, None)
+        if announce:
+            announce.cancel()
+
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        """Called when a channel is created; refresh the guild's voice channel list."""
+        if isinstance(channel, discord.VoiceChannel):
+            self._vc_cache.pop(channel.guild.id, None)
+
+    async def on_guild_channel_update(self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel):
+        """Called when a channel is edited; a moved voice channel changes the cached list order."""
+        if isinstance(after, discord.VoiceChannel) and before.position != after.position:
+            self._vc_cache.pop(after.guild.id, None)
+
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Called when a channel is deleted; refresh the guild's voice channel list."""
+        if isinstance(channel, discord.VoiceChannel):
+            self._vc_cache.pop(channel.guild.id, None)
+            counts = self._human_counts.get(channel.guild.id)
+            if counts is not None:
+                counts.pop(channel.id, None)
 
     @newrelic.agent.background_task(name='Discord.on_error')
     async def on_error(self, event, *args, **kwargs):
@@ -614,34 +1227,22 @@ class BellboyBot(discord.Client):
         newrelic.agent.record_custom_metric('Custom/Discord/Errors', 1)
         newrelic.agent.notice_error()
 
-        self.logger.error(f'An error occurred in event {event}', exc_info=True)
+        self.logger.error('An error occurred in event %s', event, exc_info=True)
 
     def _is_ignored_user(self, member: discord.Member) -> bool:
         """Check if a member is in the ignored users list."""
-        if not IGNORED_USERS.strip():
-            return False
-        ignored_ids = [uid.strip() for uid in IGNORED_USERS.split(',') if uid.strip()]
-        return str(member.id) in ignored_ids
+        return member.id in IGNORED_USER_IDS
 
     def _is_human_member(self, member: discord.Member) -> bool:
-        """Check if a member is a real human user (not bot, app, or system user)."""
-        # Skip if it's a bot
-        if member.bot:
-            return False
-
-        # Skip if it's the bot itself (extra safety check)
-        if self.user and member.id == self.user.id:
-            return False
-
-        # Skip if it's a system user or application (if the attribute exists)
-        if hasattr(member, 'system') and member.system:
-            return False
-
-        # Skip if it's a webhook user
-        if hasattr(member, 'discriminator') and member.discriminator == '0000':
-            return False
-
-        return True
+        """Check if a member is a real human user (not bot, app, system or webhook user, nor the bot itself)."""
+        # discord.py 2.x Members always expose system and discriminator, so no attribute probing;
+        # the cheapest and most selective check (bot) short-circuits first
+        return not (
+            member.bot
+            or member.id == self._bot_user_id
+            or member.system
+            or member.discriminator == WEBHOOK_DISCRIMINATOR
+        )
 
     @newrelic.agent.background_task(name='Discord.Bot.TestTransaction')
     def _test_newrelic_transaction(self):
@@ -654,7 +1255,7 @@ class BellboyBot(discord.Client):
             })
             self.logger.info("New Relic test transaction recorded successfully")
         except Exception as e:
-            self.logger.error(f"New Relic test transaction failed: {e}")
+            self.logger.error("New Relic test transaction failed: %s", e)
 
 @newrelic.agent.background_task(name='Discord.Bot.Main')
 def main():
@@ -664,6 +1265,10 @@ def main():
         print("Error: DISCORD_TOKEN is required but not set in environment variables or .env file")
         return
 
+    # Use uvloop's libuv-based event loop when it is installed
+    if UVLOOP_AVAILABLE:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     # Create and run the bot
     bot = BellboyBot()
 
@@ -686,7 +1291,10 @@ def main():
         newrelic.agent.record_custom_metric('Custom/Bot/FatalError', 1)
         newrelic.agent.notice_error()
         print(f"Error running bot: {e}")
-        logging.getLogger('bellboy').error(f"Fatal error running bot: {e}", exc_info=True)
+        logger.error("Fatal error running bot: %s", e, exc_info=True)
+    finally:
+        # Flush any queued log records before exiting
+        bot._log_listener.stop()
 
 
 if __name__ == "__main__":
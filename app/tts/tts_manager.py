@@ -1,18 +1,29 @@
 """
 TTS Manager module for handling multiple TTS providers.
 """
+import asyncio
+import functools
+import glob
 import os
 import yaml
-import logging
 import tempfile
 import subprocess
 import hashlib
-import random
 import time
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Union
 from pathlib import Path
 
+# Log through the same backend as the bot (see USE_PICOLOGGING in bellboy.py) so
+# 'bellboy.tts.*' records reach its handlers
+try:
+    if os.getenv('USE_PICOLOGGING', '').lower() not in ('1', 'true', 'yes') or os.getenv('NEW_RELIC_LICENSE_KEY'):
+        raise ImportError('picologging not enabled')
+    import picologging as logging
+except ImportError:
+    import logging
+
 # Import TTS libraries with fallback
 try:
     from TTS.api import TTS
@@ -28,6 +39,9 @@ except ImportError:
     EDGE_TTS_AVAILABLE = False
     edge_tts = None
 
+# Special users are parsed once at import; SPECIAL_USERS is constant for the process lifetime
+SPECIAL_USER_IDS = frozenset(uid.strip() for uid in os.getenv('SPECIAL_USERS', '').split(',') if uid.strip())
+
 
 class TTSProvider(ABC):
     """Abstract base class for TTS providers."""
@@ -56,6 +70,36 @@ class TTSProvider(ABC):
 
     def get_message(self, message_type: str, **kwargs) -> str:
         """Get a formatted message for the given type, picked randomly from the list."""
+        template = self._get_template(message_type, **kwargs)
+
+        # Support list of messages — pick one
+        if isinstance(template, list):
+            template = template[int(time.time() * 1000) % len(template)]
+
+        return template.format(**kwargs)
+
+    def get_message_variants(self, message_type: str, **kwargs) -> List[str]:
+        """Get every formatted message get_message could return for the given type."""
+        template = self._get_template(message_type, **kwargs)
+        templates = template if isinstance(template, list) else [template]
+        return [t.format(**kwargs) for t in templates]
+
+    def get_group_message(self, message_type: str, display_names: List[str]) -> str:
+        """Get a formatted message announcing several members at once."""
+        if len(display_names) > 1:
+            conjunction = self.config.get('name_conjunction', 'and')
+            names = f"{', '.join(display_names[:-1])} {conjunction} {display_names[-1]}"
+        else:
+            names = display_names[0]
+
+        # Prefer a dedicated plural template, fall back to the regular one
+        group_type = f"{message_type}_many"
+        if group_type in self.config.get('messages', {}):
+            return self.get_message(group_type, display_name=names)
+        return self.get_message(message_type, display_name=names)
+
+    def _get_template(self, message_type: str, **kwargs) -> Union[str, List[str]]:
+        """Get the configured template (or list of templates) for a message type and member."""
         messages = self.config.get('messages', {})
 
         # Check if this is a special user
@@ -72,22 +116,74 @@ class TTSProvider(ABC):
             # Use regular message for normal users
             template = messages.get(message_type, f"{message_type} {{display_name}}")
 
-        # Support list of messages — pick one
-        if isinstance(template, list):
-            template = template[int(time.time() * 1000) % len(template)]
-
-        return template.format(**kwargs)
+        return template
 
     def _is_special_user(self, user_id: str) -> bool:
         """Check if a user ID is in the special users list."""
-        import os
-        special_users = os.getenv('SPECIAL_USERS', '')
-        if not special_users.strip():
-            return False
+        return user_id in SPECIAL_USER_IDS
+
+    async def _convert_audio(self, source_path: str, output_path: str) -> bool:
+        """Convert an intermediate audio file to MP3 or Opus (picked by the output extension) using ffmpeg."""
+        try:
+            settings = self.config.get('settings', {})
+            audio_quality = settings.get('audio_quality', '64k')
+
+            if output_path.endswith('.opus'):
+                # Encoded exactly as Discord sends it (48 kHz stereo Opus, volume applied here),
+                # so the bot can replay the packets without running ffmpeg at all
+                codec_args = [
+                    '-map_metadata', '-1',
+                    '-filter:a', f"volume={settings.get('volume', '1.1')}",
+                    '-codec:a', 'libopus',
+                    '-b:a', audio_quality,
+                    '-ar', '48000', '-ac', '2',
+                    '-application', 'voip',
+                    '-fec', 'true', '-packet_loss', '15',
+                ]
+            else:
+                # Speech clips are short and re-encoded to Opus for Discord, so favour encode speed:
+                # mono and the fastest LAME algorithm
+                codec_args = [
+                    '-codec:a', 'libmp3lame',
+                    '-compression_level', '9',
+                    '-b:a', audio_quality,
+                    '-ac', '1',
+                ]
+
+            ffmpeg_cmd = [
+                'ffmpeg', '-y',  # Overwrite output
+                '-hide_banner', '-loglevel', 'error',
+                '-i', source_path,
+                *codec_args,
+                output_path
+            ]
+
+            # Run ffmpeg in thread to avoid blocking event loop
+            loop = asyncio.get_event_loop()
+            result = await loop.run_in_executor(
+                None,
+                lambda: subprocess.run(ffmpeg_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=30)
+            )
+
+            # Clean up the intermediate file
+            try:
+                os.unlink(source_path)
+            except OSError:
+                pass
 
-        # Parse comma-separated user IDs
-        special_user_ids = [uid.strip() for uid in special_users.split(',') if uid.strip()]
-        return user_id in special_user_ids
+            if result.returncode == 0:
+                self.logger.debug("Successfully converted audio: %s", output_path)
+                return True
+            else:
+                self.logger.error("ffmpeg conversion failed: %s", result.stderr.decode('utf-8', 'replace'))
+                return False
+
+        except subprocess.TimeoutExpired:
+            self.logger.error("ffmpeg conversion timed out")
+            return False
+        except Exception as e:
+            self.logger.error(f"Error converting audio: {e}")
+            return False
 
 
 class CoquiTTSProvider(TTSProvider):
@@ -108,11 +204,12 @@ class CoquiTTSProvider(TTSProvider):
             return False
 
         try:
-            import asyncio
-
             model = self.config.get('model', 'tts_models/en/ljspeech/tacotron2-DDC')
             settings = self.config.get('settings', {})
             progress_bar = settings.get('progress_bar', False)
+            # Device: env var > config > auto (CUDA when available)
+            device = os.getenv('TTS_DEVICE') or settings.get('device', 'auto')
+            half_precision = settings.get('half_precision', False)
 
             self.logger.info(f"Initializing Coqui TTS with model: {model}")
             self.logger.info("This may take a few minutes on first run (downloading model)...")
@@ -120,7 +217,24 @@ class CoquiTTSProvider(TTSProvider):
             def init_tts():
                 """Initialize TTS in a separate thread."""
                 try:
-                    return TTS(model_name=model, progress_bar=progress_bar)
+                    tts = TTS(model_name=model, progress_bar=progress_bar)
+                    target_device = self._resolve_device(device)
+                    precision = 'fp32'
+                    if target_device != 'cpu':
+                        tts.to(target_device)
+                        # fp16 halves weight bandwidth on GPU; it is slower than fp32 on CPU
+                        if half_precision:
+                            tts.synthesizer.tts_model.half()
+                            precision = 'fp16'
+                    self.logger.info(f"Coqui TTS running on {target_device} ({precision})")
+
+                    # Run one short synthesis so lazy model setup isn't paid by the first announcement
+                    if settings.get('warmup', True) and not self._warmup(tts) and precision == 'fp16':
+                        # Every real synthesis would fail the same way - go back to fp32 and try again
+                        self.logger.warning("Coqui TTS fp16 warmup failed, falling back to fp32")
+                        tts.synthesizer.tts_model.float()
+                        self._warmup(tts)
+                    return tts
                 except Exception as e:
                     self.logger.error(f"TTS initialization failed: {e}")
                     if "github" in str(e).lower() or "download" in str(e).lower():
@@ -144,6 +258,28 @@ class CoquiTTSProvider(TTSProvider):
             self.logger.error("TTS will be disabled. Bot will continue without voice announcements.")
             return False
 
+    def _warmup(self, tts: Any) -> bool:
+        """Run a short dummy synthesis, returning whether it succeeded."""
+        try:
+            start = time.perf_counter()
+            tts.tts(text="ola")
+            self.logger.info(f"Coqui TTS warmup completed in {time.perf_counter() - start:.2f}s")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Coqui TTS warmup failed: {e}")
+            return False
+
+    @staticmethod
+    def _resolve_device(device: str) -> str:
+        """Resolve the configured device, picking CUDA for 'auto' when a GPU is present."""
+        if device != 'auto':
+            return device
+        try:
+            import torch
+            return 'cuda' if torch.cuda.is_available() else 'cpu'
+        except ImportError:
+            return 'cpu'
+
     async def synthesize(self, text: str, output_path: str, **kwargs) -> bool:
         """Synthesize text using Coqui TTS."""
         if not self.is_initialized or self.tts is None:
@@ -151,83 +287,38 @@ class CoquiTTSProvider(TTSProvider):
             return False
 
         try:
-            import asyncio
-
             # Ensure output directory exists
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-            # Create temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_wav:
-                temp_wav_path = temp_wav.name
+            # WAV is written in place; MP3/Opus output is encoded from an intermediate WAV
+            convert = not output_path.endswith('.wav')
+            if convert:
+                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_wav:
+                    wav_path = temp_wav.name
+            else:
+                wav_path = output_path
 
             # Log synthesis start
-            self.logger.debug(f"Starting Coqui TTS synthesis for text length: {len(text)} characters")
+            self.logger.debug("Starting Coqui TTS synthesis for text length: %s characters", len(text))
 
             # Generate speech in thread to avoid blocking event loop
             loop = asyncio.get_event_loop()
             await loop.run_in_executor(
                 None,
-                lambda: self.tts.tts_to_file(text=text, file_path=temp_wav_path)
+                lambda: self.tts.tts_to_file(text=text, file_path=wav_path)
             )
 
-            self.logger.debug(f"Coqui TTS synthesis completed, converting to {output_path.split('.')[-1].upper()}")
+            if convert:
+                self.logger.debug("Coqui TTS synthesis completed, converting to %s", os.path.splitext(output_path)[1])
+                return await self._convert_audio(wav_path, output_path)
 
-            # Convert to MP3 if needed
-            if output_path.endswith('.mp3'):
-                return await self._convert_to_mp3(temp_wav_path, output_path)
-            else:
-                # Just rename/move the WAV file
-                os.rename(temp_wav_path, output_path)
-                self.logger.debug(f"WAV file saved: {os.path.basename(output_path)}")
-                return True
+            self.logger.debug("WAV file saved: %s", os.path.basename(output_path))
+            return True
 
         except Exception as e:
             self.logger.error(f"Coqui TTS synthesis failed: {e}")
             return False
 
-    async def _convert_to_mp3(self, wav_path: str, mp3_path: str) -> bool:
-        """Convert WAV to MP3 using ffmpeg."""
-        try:
-            import asyncio
-
-            settings = self.config.get('settings', {})
-            audio_quality = settings.get('audio_quality', '128k')
-
-            ffmpeg_cmd = [
-                'ffmpeg', '-y',  # Overwrite output
-                '-i', wav_path,
-                '-codec:a', 'mp3',
-                '-b:a', audio_quality,
-                mp3_path
-            ]
-
-            # Run ffmpeg in thread to avoid blocking event loop
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                lambda: subprocess.run(ffmpeg_cmd, capture_output=True, text=True, timeout=30)
-            )
-
-            # Clean up temporary WAV file
-            try:
-                os.unlink(wav_path)
-            except OSError:
-                pass
-
-            if result.returncode == 0:
-                self.logger.debug(f"Successfully converted to MP3: {mp3_path}")
-                return True
-            else:
-                self.logger.error(f"ffmpeg conversion failed: {result.stderr}")
-                return False
-
-        except subprocess.TimeoutExpired:
-            self.logger.error("ffmpeg conversion timed out")
-            return False
-        except Exception as e:
-            self.logger.error(f"Error converting to MP3: {e}")
-            return False
-
 
 class EdgeTTSProvider(TTSProvider):
     """Edge TTS provider implementation using Microsoft neural voices."""
@@ -254,11 +345,28 @@ class EdgeTTSProvider(TTSProvider):
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             voice = self.config.get('voice', 'pt-BR-FranciscaNeural')
-            self.logger.debug(f"Starting Edge TTS synthesis for text length: {len(text)} characters")
+            self.logger.debug("Starting Edge TTS synthesis for text length: %s characters", len(text))
             communicate = edge_tts.Communicate(text, voice)
-            await communicate.save(output_path)
-            self.logger.debug(f"Edge TTS synthesis completed: {os.path.basename(output_path)}")
-            return True
+
+            # Edge streams MP3; any other output format is encoded from it
+            if output_path.endswith('.mp3'):
+                await communicate.save(output_path)
+                self.logger.debug("Edge TTS synthesis completed: %s", os.path.basename(output_path))
+                return True
+
+            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_mp3:
+                mp3_path = temp_mp3.name
+            try:
+                await communicate.save(mp3_path)
+            except Exception:
+                # _convert_audio cleans up the intermediate file, but it is never reached here
+                try:
+                    os.unlink(mp3_path)
+                except OSError:
+                    pass
+                raise
+            self.logger.debug("Edge TTS synthesis completed, converting to %s", os.path.splitext(output_path)[1])
+            return await self._convert_audio(mp3_path, output_path)
         except Exception as e:
             self.logger.error(f"Edge TTS synthesis failed: {e}")
             return False
@@ -269,7 +377,8 @@ class TTSCacheManager:
 
     def __init__(self, cache_config: Dict[str, Any]):
         self.config = cache_config
-        self.cache = {}  # filepath -> timestamp
+        self.cache: 'OrderedDict[str, int]' = OrderedDict()  # filepath -> size in bytes, least recently used first
+        self.total_size = 0
         self.logger = logging.getLogger('bellboy.tts.cache')
 
         # Ensure cache directory exists
@@ -295,19 +404,35 @@ class TTSCacheManager:
         if not self.config.get('enabled', True):
             return
 
-        self.cache[file_path] = time.time()
-        self.logger.debug(f"Added file to cache: {os.path.basename(file_path)} (total cached: {len(self.cache)})")
+        try:
+            file_size = os.path.getsize(file_path)
+        except OSError:
+            file_size = 0
+
+        # Re-adding a tracked file replaces its size and makes it most recently used
+        self.total_size += file_size - self.cache.pop(file_path, 0)
+        self.cache[file_path] = file_size
+        self.logger.debug("Added file to cache: %s (total cached: %s)", os.path.basename(file_path), len(self.cache))
         self._cleanup_if_needed()
 
+    def touch(self, file_path: str) -> None:
+        """Mark a cached file as recently used so it is evicted last."""
+        if file_path in self.cache:
+            self.cache.move_to_end(file_path)
+
+    def untrack(self, file_path: str) -> None:
+        """Stop tracking a file without deleting it; it is re-added once it's confirmed good again."""
+        if file_path in self.cache:
+            self.total_size -= self.cache.pop(file_path)
+
     def invalidate_file(self, file_path: str) -> bool:
         """Remove a file from cache and filesystem."""
         try:
             if os.path.exists(file_path):
                 os.remove(file_path)
-                self.logger.debug(f"Invalidated cache file: {os.path.basename(file_path)}")
+                self.logger.debug("Invalidated cache file: %s", os.path.basename(file_path))
 
-            if file_path in self.cache:
-                del self.cache[file_path]
+            self.untrack(file_path)
 
             return True
         except OSError as e:
@@ -315,45 +440,33 @@ class TTSCacheManager:
             return False
 
     def _get_total_size(self) -> int:
-        """Calculate total size in bytes of all tracked cache files."""
-        total = 0
-        for file_path in self.cache:
-            try:
-                if os.path.exists(file_path):
-                    total += os.path.getsize(file_path)
-            except OSError:
-                pass
-        return total
+        """Total size in bytes of all tracked cache files."""
+        return self.total_size
 
     def _cleanup_if_needed(self) -> None:
-        """Clean up old cache files if size limit exceeded."""
-        total_size = self._get_total_size()
-
-        if total_size <= self.max_size_bytes:
+        """Clean up least recently used cache files if size limit exceeded."""
+        if self.total_size <= self.max_size_bytes:
             return
 
         max_size_mb = self.max_size_bytes / (1024 * 1024)
         self.logger.info(
-            f"Cache size limit exceeded ({total_size / (1024*1024):.1f}MB/{max_size_mb:.0f}MB), "
+            f"Cache size limit exceeded ({self.total_size / (1024*1024):.1f}MB/{max_size_mb:.0f}MB), "
             f"cleaning up oldest files"
         )
 
-        # Sort by timestamp, remove oldest first until under limit
-        sorted_cache = sorted(self.cache.items(), key=lambda x: x[1])
-        for file_path, _ in sorted_cache:
-            if total_size <= self.max_size_bytes:
-                break
+        # Evict from the least recently used end until under limit
+        while self.cache and self.total_size > self.max_size_bytes:
+            file_path, file_size = self.cache.popitem(last=False)
+            self.total_size -= file_size
             try:
-                file_size = os.path.getsize(file_path) if os.path.exists(file_path) else 0
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                del self.cache[file_path]
-                total_size -= file_size
-                self.logger.debug(f"Removed old cache file: {os.path.basename(file_path)}")
+                os.remove(file_path)
+                self.logger.debug("Removed old cache file: %s", os.path.basename(file_path))
+            except FileNotFoundError:
+                pass
             except OSError as e:
                 self.logger.warning(f"Could not remove cache file {os.path.basename(file_path)}: {e}")
 
-        self.logger.info(f"Cache cleanup completed. Current size: {total_size / (1024*1024):.1f}MB/{max_size_mb:.0f}MB")
+        self.logger.info(f"Cache cleanup completed. Current size: {self.total_size / (1024*1024):.1f}MB/{max_size_mb:.0f}MB")
 
     def _scan_existing_cache(self) -> None:
         """Scan cache directory for existing files and add them to tracking."""
@@ -363,24 +476,25 @@ class TTSCacheManager:
         cache_dir = self.config.get('directory', '/app/assets')
         try:
             if os.path.exists(cache_dir):
-                # Look for TTS files (mp3, wav)
-                import glob
-                patterns = ['*.mp3', '*.wav']
+                # Look for TTS files (mp3, wav, opus)
+                patterns = ['*.mp3', '*.wav', '*.opus']
                 existing_files = []
 
                 for pattern in patterns:
                     existing_files.extend(glob.glob(os.path.join(cache_dir, pattern)))
 
-                # Add existing files to cache with current timestamp
-                current_time = time.time()
+                # Track existing files oldest first, so the LRU order starts from modification time
+                entries = []
                 for file_path in existing_files:
-                    if os.path.isfile(file_path):
-                        # Use file modification time if available, otherwise current time
-                        try:
-                            file_time = os.path.getmtime(file_path)
-                        except OSError:
-                            file_time = current_time
-                        self.cache[file_path] = file_time
+                    try:
+                        stat = os.stat(file_path)
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, file_path, stat.st_size))
+
+                for _, file_path, file_size in sorted(entries):
+                    self.cache[file_path] = file_size
+                    self.total_size += file_size
 
                 if existing_files:
                     self.logger.info(f"Found {len(existing_files)} existing TTS files in cache")
@@ -419,6 +533,9 @@ class TTSManager:
         self.provider_name = provider_name or os.getenv('TTS_PROVIDER') or self.config.get('default_provider', 'coqui')
         self.provider = None
 
+        # Renders in progress: output_path -> task, so concurrent requests for one file share it
+        self._pending_synthesis: Dict[str, asyncio.Task] = {}
+
         # Provider registry
         self.providers = {
             'coqui': CoquiTTSProvider,
@@ -452,8 +569,8 @@ class TTSManager:
                     'model': 'tts_models/en/ljspeech/tacotron2-DDC',  # Faster model for quick init
                     'settings': {
                         'progress_bar': False,
-                        'output_format': 'mp3',
-                        'audio_quality': '128k'
+                        'output_format': 'opus',
+                        'audio_quality': '64k'
                     },
                     'messages': {
                         'join': 'Welcome {display_name}',
@@ -516,10 +633,18 @@ class TTSManager:
         try:
             text = self.provider.get_message(message_type, **kwargs)
 
-            # Check if file exists and validate it matches expected text
-            if os.path.exists(output_path):
+            # A render of this file is in progress - it may exist on disk but isn't complete yet
+            if output_path in self._pending_synthesis:
+                return await self._render(text, output_path)
+
+            # Check if file exists (files tracked by the cache are known to) and validate it matches expected text
+            if output_path in self.cache_manager.cache or os.path.exists(output_path):
                 if self.validate_cache_file(text, output_path):
-                    self.logger.info(f"Using cached TTS file: {os.path.basename(output_path)} for message '{message_type}'")
+                    if output_path in self.cache_manager.cache:
+                        self.cache_manager.touch(output_path)
+                    else:
+                        self.cache_manager.add_file(output_path)
+                    self.logger.info("Using cached TTS file: %s for message '%s'", os.path.basename(output_path), message_type)
                     return True
                 else:
                     self.logger.info(f"Cache file invalid for message '{message_type}', regenerating...")
@@ -527,7 +652,7 @@ class TTSManager:
 
             # Generate new TTS audio
             self.logger.info(f"Generating new TTS audio for message '{message_type}': '{text}'")
-            success = await self.provider.synthesize(text, output_path)
+            success = await self._render(text, output_path)
 
             if success:
                 self.logger.info(f"TTS audio generated successfully: {os.path.basename(output_path)}")
@@ -548,18 +673,26 @@ class TTSManager:
             return False
 
         try:
-            # Check if file exists and validate it matches expected text
-            if os.path.exists(output_path):
+            # A render of this file is in progress - it may exist on disk but isn't complete yet
+            if output_path in self._pending_synthesis:
+                return await self._render(text, output_path, **kwargs)
+
+            # Check if file exists (files tracked by the cache are known to) and validate it matches expected text
+            if output_path in self.cache_manager.cache or os.path.exists(output_path):
                 if self.validate_cache_file(text, output_path):
-                    self.logger.info(f"Using cached TTS file: {os.path.basename(output_path)} for text: '{text[:50]}{'...' if len(text) > 50 else ''}'")
+                    if output_path in self.cache_manager.cache:
+                        self.cache_manager.touch(output_path)
+                    else:
+                        self.cache_manager.add_file(output_path)
+                    self.logger.info("Using cached TTS file: %s for text: '%.50s'", os.path.basename(output_path), text)
                     return True
                 else:
-                    self.logger.info(f"Cache file invalid for text, regenerating...")
+                    self.logger.info("Cache file invalid for text, regenerating...")
                     self.cache_manager.invalidate_file(output_path)
 
             # Generate new TTS audio
             self.logger.info(f"Generating new TTS audio for text: '{text[:50]}{'...' if len(text) > 50 else ''}'")
-            success = await self.provider.synthesize(text, output_path, **kwargs)
+            success = await self._render(text, output_path, **kwargs)
 
             if success:
                 self.logger.info(f"TTS audio generated successfully: {os.path.basename(output_path)}")
@@ -573,33 +706,42 @@ class TTSManager:
             self.logger.error(f"Error synthesizing text: {e}")
             return False
 
-    def generate_cache_path(self, text: str, prefix: str = "tts", suffix: str = ".mp3") -> str:
-        """Generate a cache path for TTS audio."""
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _text_hash(text: str) -> str:
+        """Hash text into a cache key (non-cryptographic use; blake2b is faster than MD5)."""
+        # 16-byte digest keeps the collision resistance of the previous full MD5
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def generate_cache_path(self, text: str, prefix: str = "tts", suffix: Optional[str] = None) -> str:
+        """Generate a cache path for TTS audio, in the provider's output format unless a suffix is given."""
+        if suffix is None:
+            settings = self.provider.config.get('settings', {}) if self.provider else {}
+            suffix = f".{settings.get('output_format', 'mp3')}"
         cache_dir = self.cache_manager.config.get('directory', '/app/assets')
-        # Use full hash for better collision resistance
-        text_hash = hashlib.md5(text.encode()).hexdigest()
+        text_hash = self._text_hash(text)
         filename = f"{prefix}_{self.provider_name}_{text_hash}{suffix}"
         return os.path.join(cache_dir, filename)
 
     def validate_cache_file(self, expected_text: str, file_path: str) -> bool:
         """Validate that a cached file matches the expected text."""
-        if not os.path.exists(file_path):
+        if file_path not in self.cache_manager.cache and not os.path.exists(file_path):
             return False
 
         # Extract hash from filename
         filename = os.path.basename(file_path)
         try:
-            # Expected format: prefix_provider_hash.extension
-            parts = filename.split('_')
+            # Expected format: prefix_provider_hash.extension (the prefix itself may contain '_')
+            parts = filename.rsplit('_', 2)
             if len(parts) < 3:
                 return False
 
             # Get hash part (remove extension)
-            hash_with_ext = parts[2]
+            hash_with_ext = parts[-1]
             cached_hash = hash_with_ext.split('.')[0]
 
             # Calculate expected hash
-            expected_hash = hashlib.md5(expected_text.encode()).hexdigest()
+            expected_hash = self._text_hash(expected_text)
 
             return cached_hash == expected_hash
 
@@ -607,12 +749,39 @@ class TTSManager:
             self.logger.warning(f"Invalid cache filename format: {filename}")
             return False
 
+    async def _render(self, text: str, output_path: str, **kwargs) -> bool:
+        """Synthesize text to output_path, joining a render of the same file that is already running."""
+        task = self._pending_synthesis.get(output_path)
+        if task is None:
+            task = asyncio.ensure_future(self.provider.synthesize(text, output_path, **kwargs))
+            self._pending_synthesis[output_path] = task
+            task.add_done_callback(lambda _: self._pending_synthesis.pop(output_path, None))
+        # Shielded so a cancelled caller doesn't abort a render others are waiting for
+        return await asyncio.shield(task)
+
     def get_message(self, message_type: str, **kwargs) -> Optional[str]:
         """Get a formatted message for the given type via the active provider."""
         if not self.provider:
             return None
         return self.provider.get_message(message_type, **kwargs)
 
+    def get_message_variants(self, message_type: str, **kwargs) -> List[str]:
+        """Get every formatted variant of a message type via the active provider."""
+        if not self.provider:
+            return []
+        return self.provider.get_message_variants(message_type, **kwargs)
+
+    def get_group_message(self, message_type: str, display_names: List[str]) -> Optional[str]:
+        """Get a formatted message announcing several members via the active provider."""
+        if not self.provider or not display_names:
+            return None
+        return self.provider.get_group_message(message_type, display_names)
+
+    @property
+    def prewarm_enabled(self) -> bool:
+        """Check if leave/move clips should be pre-synthesized in the background."""
+        return self.provider is not None and self.provider.config.get('settings', {}).get('prewarm', True)
+
     @property
     def is_available(self) -> bool:
         """Check if TTS is available and initialized."""